@@ -1,14 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cache
 
 from msgspec.json import decode
 from rich import pretty
 from rich.console import ConsoleRenderable, Group
-from rich.highlighter import ReprHighlighter
 from rich.panel import Panel
 from rich.text import Text
 
 from woid.common import WS_JSON_PATH, is_verbose
+from woid.log import HIGHLIGHTER
 
 
 @dataclass
@@ -16,6 +16,10 @@ class Field:
     name: str
     help: str
     required: bool
+    text: Text = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.text = Text.from_markup(f"[u]{self.name}[/u]: {self.help}\n")
 
 
 @dataclass
@@ -24,18 +28,45 @@ class Example:
     code: str
 
 
+# Field descriptions are static, so their markup is parsed once at import rather than per help string:
+_HOST_URL_FIELD = Field(
+    name="url",
+    help="https/git URL of a git server that hosts projects.",
+    required=True,
+)
+_PROJECT_HOST_FIELD = Field(
+    name="host",
+    help="Name of the host that has this project.",
+    required=True,
+)
+_WORKSPACE_VERSION_FIELD = Field(
+    name="version",
+    help="Version of the woid manifest format, as <MAJOR>.<MINOR>.",
+    required=True,
+)
+_WORKSPACE_HOSTS_FIELD = Field(
+    name="hosts",
+    help="Named git servers that host projects; each one defines a [u]url[/u].",
+    required=True,
+)
+_WORKSPACE_PROJECTS_FIELD = Field(
+    name="projects",
+    help="Named projects of the workspace; each one defines its [u]host[/u].",
+    required=True,
+)
+_VERBOSE_HINT = Text.from_markup("Use [green]woid -v[/green] for examples.")
+
+
 def _create_help(fields: list[Field], examples: list[Example]) -> ConsoleRenderable:
     renderables: list[ConsoleRenderable] = []
     try:
-        for field in fields:
-            arg_render = Text.from_markup(f"[u]{field.name}[/u]: {field.help}\n")
-            renderables.append(arg_render)
+        renderables.extend(f.text for f in fields)
 
         if is_verbose():
             for i, example in enumerate(examples):
                 prettified_value = pretty.Pretty(
                     decode(example.code),
-                    highlighter=ReprHighlighter(),
+                    highlighter=HIGHLIGHTER,
                     indent_guides=True,
                     expand_all=True,
                 )
@@ -43,7 +74,7 @@ def _create_help(fields: list[Field], examples: list[Example]) -> ConsoleRendera
                 example_panel = Panel(prettified_value, title=title, border_style="green", title_align="left")
                 renderables.append(example_panel)
         else:
-            renderables.append(Text.from_markup("Use [green]woid -v[/green] for examples."))
+            renderables.append(_VERBOSE_HINT)
         return Group(*renderables)
     except Exception:  # noqa: BLE001
         return Group(Text("Failed to create help string (internal woid error).", style="red"))
@@ -53,14 +84,33 @@ class Help:
     class JsonFields:
         @cache
         @staticmethod
-        def host_url() -> ConsoleRenderable:
-            fields = [
-                Field(
-                    name="url",
-                    help="https/git URL of a git server that hosts projects.",
-                    required=True,
+        def workspace() -> ConsoleRenderable:
+            fields = [_WORKSPACE_VERSION_FIELD, _WORKSPACE_HOSTS_FIELD, _WORKSPACE_PROJECTS_FIELD]
+            examples = [
+                Example(
+                    name="Minimal workspace",
+                    code="""
+                        {
+                            "version": "0.1",
+                            "hosts": {
+                                "google": {
+                                    "url": "https://github.com/google"
+                                }
+                            },
+                            "projects": {
+                                "googletest": {
+                                    "host": "google"
+                                }
+                            }
+                        }""",
                 )
             ]
+            return _create_help(fields, examples)
+
+        @cache
+        @staticmethod
+        def host_url() -> ConsoleRenderable:
+            fields = [_HOST_URL_FIELD]
 
             examples = [
                 Example(
@@ -81,13 +131,7 @@ class Help:
         @cache
         @staticmethod
         def project_host() -> ConsoleRenderable:
-            fields = [
-                Field(
-                    name="host",
-                    help="Name of the host that has this project.",
-                    required=True,
-                )
-            ]
+            fields = [_PROJECT_HOST_FIELD]
             examples = [
                 Example(
                     name="One host, two projects",
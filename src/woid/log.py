@@ -1,5 +1,10 @@
+import atexit
 import logging
+import os
+import queue
 import sys
+import threading
+from collections.abc import Callable
 from functools import cache
 from typing import Any, NoReturn
 
@@ -22,14 +27,40 @@ _custom_log_themes = Theme(
     }
 )
 
+_CONSOLE = Console(theme=_custom_log_themes)
+# Shared with other modules that pretty-print values (e.g. help), so that only one instance exists:
+HIGHLIGHTER = ReprHighlighter()
 
-def _console_printer(
-    _logger: structlog.types.WrappedLogger,
-    _method_name: str,
-    event_dict: structlog.types.EventDict,
-) -> str:
-    console = Console(theme=_custom_log_themes)
-    console.begin_capture()
+# Records are rendered and written by a background thread, so that callers only pay for enqueueing:
+_LOG_QUEUE: queue.Queue[structlog.types.EventDict] = queue.Queue()
+_MAX_BATCH_SIZE: int = 64
+
+_PRINTED_KEYS: frozenset[str] = frozenset({"level", "timestamp", "event"})
+
+# Tables and pretty-printing are only worth their cost for a human watching a terminal:
+_IS_TTY: bool = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+
+
+class Lazy:
+    """Log value that is only computed if the record passes the level filter, e.g. `workspace=Lazy(ws.dump)`."""
+
+    def __init__(self, fn: Callable[[], Any]) -> None:
+        self.fn: Callable[[], Any] = fn
+
+
+def _render_plain(event_dict: structlog.types.EventDict, lvl: str, extras: dict[str, Any]) -> str:
+    line = f"[{event_dict['timestamp']}] {lvl}{event_dict['event']}"
+    for key, value in extras.items():
+        if isinstance(value, ConsoleRenderable):
+            # E.g. help strings; there is no cheaper textual form of these than rendering them:
+            _CONSOLE.begin_capture()
+            _CONSOLE.print(value)
+            value = _CONSOLE.end_capture().strip()  # noqa: PLW2901
+        line += f" {key}={value!r}"
+    return line
+
+
+def _render(event_dict: structlog.types.EventDict) -> str:
     level: str = event_dict["level"]
     match level:
         case "warning":
@@ -39,26 +70,28 @@ def _console_printer(
         case _:
             lvl = ""
 
+    # Skip the values that are already printed in the primary message, no need to duplicate them:
+    extras = {k: v for k, v in event_dict.items() if k not in _PRINTED_KEYS}
+
+    if not _IS_TTY:
+        return _render_plain(event_dict, lvl, extras)
+
     # Print out the primary event message; derive color from error level:
+    _CONSOLE.begin_capture()
     fmt: str = f"[{level}][{event_dict['timestamp']}] {lvl}{event_dict['event']}[/]"
-    console.print(fmt)
+    _CONSOLE.print(fmt)
 
-    # These values are already printed above, no need to duplicate them:
-    for key in ["level", "timestamp", "event"]:
-        if key in event_dict:
-            event_dict.pop(key)
-
-    # Format event dictionary into a Rich Table:
-    if event_dict:
+    # Format the remaining values into a Rich Table:
+    if extras:
         table = Table(box=box.ROUNDED, border_style=level, show_header=False, show_lines=True, expand=False)
         table.add_column("name", justify="right", style=level, max_width=10)
-        for key, value in event_dict.items():
+        for key, value in extras.items():
             key_text = key.replace("_", " ")
 
             if isinstance(value, dict):
                 prettified_value = pretty.Pretty(
                     value,
-                    highlighter=ReprHighlighter(),
+                    highlighter=HIGHLIGHTER,
                     indent_guides=True,
                     expand_all=True,
                 )
@@ -68,46 +101,130 @@ def _console_printer(
                 prettified_value = str(value).strip()
             table.add_row(key_text, prettified_value)
 
-        console.print(table)
-    return console.end_capture().strip()
+        _CONSOLE.print(table)
+    return _CONSOLE.end_capture().strip()
+
+
+def _printer_worker() -> None:
+    while True:
+        # Drain whatever has piled up since the last write, so that bursts turn into a single write+flush:
+        batch = [_LOG_QUEUE.get()]
+        while len(batch) < _MAX_BATCH_SIZE:
+            try:
+                batch.append(_LOG_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+
+        try:
+            _write_batch(batch)
+        except Exception as e:  # noqa: BLE001
+            _ = sys.stderr.write("".join(f"{d.get('event')!r} (write failed: {e!r})\n" for d in batch))
+        finally:
+            for _ in batch:
+                _LOG_QUEUE.task_done()
+
+
+def _write_batch(batch: list[structlog.types.EventDict]) -> None:
+    rendered: list[str] = []
+    for event_dict in batch:
+        try:
+            rendered.append(_render(event_dict) + "\n")
+        except Exception as e:  # noqa: BLE001
+            # Never let a broken record kill the worker, but don't lose it silently either; the records rendered
+            # so far go out first, to keep the order:
+            _ = sys.stdout.write("".join(rendered))
+            _ = sys.stdout.flush()
+            rendered.clear()
+            _ = sys.stderr.write(f"{event_dict.get('event')!r} (render failed: {e!r})\n")
+    _ = sys.stdout.write("".join(rendered))
+    _ = sys.stdout.flush()
+
+
+def _queue_printer(
+    _logger: structlog.types.WrappedLogger,
+    _method_name: str,
+    event_dict: structlog.types.EventDict,
+) -> structlog.types.EventDict:
+    # Resolved here on the calling thread, so the value describes the state at the time of logging:
+    for key, value in event_dict.items():
+        if isinstance(value, Lazy):
+            event_dict[key] = value.fn()
+    _LOG_QUEUE.put(event_dict)
+    raise structlog.DropEvent
+
+
+def flush() -> None:
+    """Block until all queued log records have been written out.
+
+    Call this before writing to the terminal directly (e.g. starting a Rich Progress), to keep the output in order.
+    """
+    _LOG_QUEUE.join()
 
 
 @cache
-def get_logger() -> structlog.types.FilteringBoundLogger:
-    structlog.configure(
+def _start_printer() -> None:
+    threading.Thread(target=_printer_worker, name="woid-log", daemon=True).start()
+    _ = atexit.register(flush)
+
+    # Uncaught exceptions (e.g. Typer's traceback) must not be printed ahead of the records logged before them:
+    excepthook = sys.excepthook
+
+    def _flushing_excepthook(*args: Any) -> None:  # noqa: ANN401
+        flush()
+        excepthook(*args)
+
+    sys.excepthook = _flushing_excepthook
+
+
+@cache
+def _configure(verbose: bool) -> structlog.types.FilteringBoundLogger:
+    _start_printer()
+    # The filtering bound logger turns methods below the level into no-ops, before any event_dict is built:
+    level = logging.DEBUG if verbose else logging.INFO
+    # Configuration is bound to the returned logger rather than set globally, so each verbosity keeps its own level.
+    # bind() resolves the lazy proxy once, so that e.g. a filtered .debug is the wrapper class's no-op method itself:
+    logger: structlog.types.FilteringBoundLogger = structlog.wrap_logger(
+        structlog.PrintLogger(),
         processors=[
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
             structlog.processors.StackInfoRenderer(),
             structlog.dev.set_exc_info,
             structlog.processors.TimeStamper(fmt="%H:%M:%S", utc=False),
-            _console_printer,
+            _queue_printer,
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(logging.NOTSET),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
-        cache_logger_on_first_use=False,
-    )
-    return structlog.get_logger()
+    ).bind()
+    return logger
+
+
+def get_logger() -> structlog.types.FilteringBoundLogger:
+    # Keyed on verbosity, so that the level follows set_verbose() without any cache invalidation:
+    return _configure(is_verbose())
 
 
-def dbg(msg: str, **kwargs: Any) -> None:  # noqa: ANN401
+# Positional args are %-interpolated into msg by structlog, and only if the record is not filtered out;
+# prefer them over f-strings for anything that may not be printed.
+def dbg(msg: str, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+    # Checked up front as well; this is the hot path, and the cheapest no-op is not calling into structlog at all:
     if is_verbose():
-        get_logger().debug(msg, **kwargs)
+        get_logger().debug(msg, *args, **kwargs)
 
 
-def inf(msg: str, **kwargs: Any) -> None:  # noqa: ANN401
-    get_logger().info(msg, **kwargs)
+def inf(msg: str, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+    get_logger().info(msg, *args, **kwargs)
 
 
-def wrn(msg: str, **kwargs: Any) -> None:  # noqa: ANN401
-    get_logger().warning(msg, **kwargs)
+def wrn(msg: str, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+    get_logger().warning(msg, *args, **kwargs)
 
 
-def err(msg: str, **kwargs: Any) -> None:  # noqa: ANN401
-    get_logger().error(msg, **kwargs)
+def err(msg: str, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+    get_logger().error(msg, *args, **kwargs)
 
 
-def fatal(msg: str, **kwargs: Any) -> NoReturn:  # noqa: ANN401
-    err(msg, **kwargs)
+def fatal(msg: str, *args: Any, **kwargs: Any) -> NoReturn:  # noqa: ANN401
+    err(msg, *args, **kwargs)
+    flush()
     sys.exit(-1)
@@ -1,16 +1,43 @@
+from functools import lru_cache
 from pathlib import Path
 import time
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.progress import Progress, SpinnerColumn, TextColumn, track
+from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from woid import log
 from woid.common import WS_JSON_PATH, set_verbose
 from woid.workspace import Workspace, print_workspace_status
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 app: typer.Typer = typer.Typer(name="woid", rich_markup_mode="rich")
 
+_DEFAULT_WS_PATH: Path = Path(".") / WS_JSON_PATH
+
+
+@lru_cache
+def _load_workspace_cached(absolute_path: str, _mtime_ns: int) -> Workspace:
+    # The modification time is only part of the cache key, so that an edited manifest gets re-parsed.
+    # The path is absolute but not resolved: a symlinked manifest must not move the workspace root.
+    return Workspace(Path(absolute_path))
+
+
+def _load_workspace(path: Path) -> Workspace:
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        # Let Workspace report the failure to read the file:
+        return Workspace(path)
+    return _load_workspace_cached(str(path.absolute()), mtime_ns)
+
+
+def _get_workspace(ctx: typer.Context) -> Workspace:
+    load: Callable[[], Workspace] = ctx.obj
+    return load()
+
 
 @app.callback(invoke_without_command=True)
 def woid(
@@ -26,14 +53,17 @@ def woid(
 ) -> None:
     """A workspace management tool for multi-repository projects."""
     if verbose:
-        log.dbg("Enabled Verbose output.")
         set_verbose(True)
+        log.dbg("Enabled Verbose output.")
 
     if ctx.invoked_subcommand:
-        log.dbg(f"Running command `{ctx.invoked_subcommand}`.")
+        log.dbg("Running command `%s`.", ctx.invoked_subcommand)
+
+    # Only parse the workspace once a command actually asks for it:
+    ctx.obj = lambda: _load_workspace(_DEFAULT_WS_PATH)
 
-    workspace = Workspace(Path(".") / WS_JSON_PATH)
-    print_workspace_status(workspace)
+    if not ctx.invoked_subcommand:
+        print_workspace_status(_get_workspace(ctx))
 
 
 class Panels:
@@ -53,16 +83,23 @@ def clone(
 
     Clones the given manifest repository and all projects.
     """
-    log.inf(f"Cloning {url}")
+    log.inf("Cloning %s", url)
     total = 0
-    for _ in track(range(1000), description="Processing..."):
-        time.sleep(0.01)
-        total += 1
-    log.inf(f"Processed {total} things.")
+    # Advance the bar in chunks rather than per item; refreshing it is costlier than the work itself:
+    chunk = 25
+    log.flush()
+    with Progress() as progress:
+        task = progress.add_task("Processing...", total=1000)
+        for _ in range(0, 1000, chunk):
+            time.sleep(0.01 * chunk)
+            total += chunk
+            progress.update(task, advance=chunk)
+    log.inf("Processed %d things.", total)
 
 
 @app.command(rich_help_panel=Panels.RepositoryManagement)
 def sync(
+    ctx: typer.Context,
     rebase: Annotated[
         bool,
         typer.Option(
@@ -73,6 +110,9 @@ def sync(
     ] = False,
 ) -> None:
     """Initialize the workspace."""
+    workspace = _get_workspace(ctx)
+    workspace.init_all_repos()
+    log.flush()
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, Any, override
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Any, NoReturn, override
 
-from msgspec.json import decode as decode_json
+import msgspec
 
 from woid import log
 from woid.common import PROJECTS_DIR, WS_JSON_PATH
@@ -12,35 +16,47 @@ from woid.help import ErrorStrings, Help
 from git import Repo
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from rich.console import ConsoleRenderable
 
 
-@dataclass
-class Host:
-    name: str
-    url: str
+# Empty strings and objects are treated as missing fields (min_length=1):
+class HostSpec(msgspec.Struct, forbid_unknown_fields=True):
+    url: Annotated[str, msgspec.Meta(min_length=1)]
 
-    def __init__(self, name: str, json: dict[str, Any]) -> None:
-        self.name = name
-        if url := json.pop("url", None):
-            self.url = str(url)
-        else:
-            log.fatal(
-                ErrorStrings.INVALID_WORKSPACE_JSON,
-                issue=f"Host '{self.name}' does not define the required field 'url'.",
-                erroneous_json={self.name: json},
-                help=Help.JsonFields.host_url(),
-            )
 
-        if len(json) != 0:
-            log.wrn(f"Host '{self.name}' has extraneous fields: {list(json.keys())}")
+class ProjectSpec(msgspec.Struct, forbid_unknown_fields=True):
+    host: Annotated[str, msgspec.Meta(min_length=1)]
+
+
+class WorkspaceSpec(msgspec.Struct, forbid_unknown_fields=True):
+    version: Annotated[str, msgspec.Meta(min_length=1)]
+    hosts: Annotated[dict[str, HostSpec], msgspec.Meta(min_length=1)]
+    projects: Annotated[dict[str, ProjectSpec], msgspec.Meta(min_length=1)]
+
+
+# Only used to report validation errors: locates the entries by name, leaving their validation to the decoders below.
+class _RawWorkspaceSpec(msgspec.Struct):
+    hosts: dict[str, msgspec.Raw] = {}
+    projects: dict[str, msgspec.Raw] = {}
+
 
+# Compiling the schema is the costly part of a typed decode; reuse this one decoder for every manifest that is loaded:
+_WS_DECODER: msgspec.json.Decoder[WorkspaceSpec] = msgspec.json.Decoder(WorkspaceSpec)
+_RAW_WS_DECODER: msgspec.json.Decoder[_RawWorkspaceSpec] = msgspec.json.Decoder(_RawWorkspaceSpec)
+_HOST_DECODER: msgspec.json.Decoder[HostSpec] = msgspec.json.Decoder(HostSpec)
+_PROJECT_DECODER: msgspec.json.Decoder[ProjectSpec] = msgspec.json.Decoder(ProjectSpec)
+
+
+class Host(msgspec.Struct):
+    name: str
+    url: str
+
+    @classmethod
+    def from_spec(cls, name: str, spec: HostSpec) -> Host:
+        return cls(name=name, url=spec.url)
 
     def dump(self) -> dict[str, Any]:
-        return {
-            "name": self.name,
-            "url": self.url,
-        }
+        return msgspec.structs.asdict(self)
 
 class ProjectStatus(Enum):
     Uninitialized = "Uninitialized"
@@ -52,52 +68,51 @@ class ProjectTracking(Enum):
     DetachedAtCommit = "Detached at commit"
     AttachedToBranch = "Attached to a branch"
 
-@dataclass
-class Project:
+# dict=True gives instances a __dict__, which cached_property needs to store its value:
+class Project(msgspec.Struct, dict=True):
     name: str
     host: Host
-    absolute_local_path: Path
+    local_path_str: str
     absolute_host_path: str
-    status: ProjectStatus
-    tracking: ProjectTracking
-    repo: Repo
-
-    def __init__(self, name: str, json: dict[str, Any], ws: Workspace) -> None:
-        self.name = name
-
-        if host_name := json.pop("host", None):
-            if host := ws.hosts.get(host_name):
-                self.host = host
-                self.absolute_host_path = host.url + "/" + str(host_name)
-            else:
-                log.fatal(
-                    ErrorStrings.INVALID_WORKSPACE_JSON,
-                    issue=(
-                        f"Project '{self.name}' references the host '{host_name}', "
-                        + f"which has not been defined in '{WS_JSON_PATH}'."
-                    ),
-                    valid_hosts=list(ws.hosts.keys()),
-                    erroneous_json={self.name: json},
-                    help=Help.JsonFields.project_host(),
-                )
-        else:
+    status: ProjectStatus = ProjectStatus.Uninitialized
+    tracking: ProjectTracking | None = None
+
+    @classmethod
+    def from_spec(cls, name: str, spec: ProjectSpec, ws: Workspace) -> Project:
+        if not (host := ws.hosts.get(spec.host)):
             log.fatal(
                 ErrorStrings.INVALID_WORKSPACE_JSON,
-                issue=f"Project '{self.name}' does not define the required field 'host'.",
-                erroneous_json={self.name: json},
+                issue=(
+                    f"Project '{name}' references the host '{spec.host}', "
+                    + f"which has not been defined in '{WS_JSON_PATH}'."
+                ),
+                valid_hosts=list(ws.hosts.keys()),
+                erroneous_json={name: msgspec.to_builtins(spec)},
                 help=Help.JsonFields.project_host(),
             )
 
-        self.absolute_local_path = ws.root_dir / self.name
+        # Joining strings is much cheaper than Path.__truediv__; the Path is only built if someone asks for it:
+        return cls(
+            name=name,
+            host=host,
+            local_path_str=os.path.join(ws.root_dir_str, name),  # noqa: PTH118
+            absolute_host_path=host.url + "/" + spec.host,
+        )
 
+    @cached_property
+    def absolute_local_path(self) -> Path:
+        return Path(self.local_path_str)
+
+    @cached_property
+    def repo(self) -> Repo:
         # TODO: Initialize and track host remote
-        self.repo = Repo.init(path=self.absolute_local_path, mkdir=True, bare=True)
+        return Repo.init(path=self.local_path_str, mkdir=True, bare=True)
 
     def dump(self) -> dict[str, Any]:
         return {
             "name": self.name,
             "host_path": self.absolute_host_path,
-            "local_path": str(self.absolute_local_path),
+            "local_path": self.local_path_str,
         }
 
 
@@ -116,70 +131,56 @@ class Workspace:
     projects: dict[str, Project]
 
     def __init__(self, path: Path) -> None:
+        abs_path = path.absolute()
         try:
-            text: str = path.read_text()
+            data: bytes = abs_path.read_bytes()
         except Exception as e:  # noqa: BLE001
-            log.fatal(f"Failed to read '{WS_JSON_PATH}'.", path=path.absolute(), error=e)
+            log.fatal(f"Failed to read '{WS_JSON_PATH}'.", path=abs_path, error=e)
 
         try:
-            json: dict[str, Any] = decode_json(text)
-        except Exception as e:  # noqa: BLE001
-            log.fatal(f"Failed to decode '{WS_JSON_PATH}'.", path=path.absolute(), error=e, dump=text)
-
-        self._woid_version = self._parse_workspace_version(json)
-        self.root_dir = path.parent.absolute()
-        self.projects_dir = self.root_dir / PROJECTS_DIR
-        self.hosts = self._parse_workspace_hosts(json)
-        self.projects = self._parse_workspace_projects(json)
-        log.dbg(f"Parsed '{WS_JSON_PATH}'.", workspace=self.dump())
-
-
-    def _parse_workspace_version(self, json: dict[str, Any]) -> Version:
-        if woid_version := json.get("version"):
-            woid_version = str(woid_version)
-            try:
-                version_major, version_minor = woid_version.split(".")
-            except ValueError:
-                log.fatal(
-                    ErrorStrings.INVALID_WORKSPACE_JSON,
-                    issue="Workspace version does not follow the format <MAJOR>.<MINOR> (e.g. '0.1').",
-                    erroneous_value=woid_version,
-                )
-        else:
+            spec: WorkspaceSpec = _WS_DECODER.decode(data)
+        except msgspec.ValidationError as e:
+            _fatal_invalid_workspace(abs_path, data, e)
+        except msgspec.DecodeError as e:
             log.fatal(
-                ErrorStrings.INVALID_WORKSPACE_JSON,
-                issue="Workspace does not define the required field 'version'.",
-                erroneous_json=json,
+                f"Failed to decode '{WS_JSON_PATH}'.",
+                path=abs_path,
+                error=e,
+                dump=data.decode("utf-8", "replace"),
             )
-        return Version(int(version_major), int(version_minor))
-
-    def _parse_workspace_hosts(self, json: dict[str, Any]) -> dict[str, Host]:
-        res: dict[str, Host] = {}
-        if hosts := json.get("hosts"):
-            for host_name, host_json in hosts.items():
-                res[host_name] = Host(name=host_name, json=host_json)
-        else:
-            log.fatal(
-                ErrorStrings.INVALID_WORKSPACE_JSON,
-                issue="Workspace does not define the required field 'hosts'.",
-                erroneous_json=json,
-            )
-        return res
 
+        self._woid_version = self._parse_workspace_version(spec.version)
+        self.root_dir = abs_path.parent
+        self.projects_dir = self.root_dir / PROJECTS_DIR
+        self.hosts = {name: Host.from_spec(name, host) for name, host in spec.hosts.items()}
+        self.projects = {name: Project.from_spec(name, project, ws=self) for name, project in spec.projects.items()}
+        log.dbg("Parsed '%s'.", WS_JSON_PATH, workspace=log.Lazy(self.dump))
 
-    def _parse_workspace_projects(self, json: dict[str, Any]) -> dict[str, Project]:
-        res: dict[str, Project] = {}
-        if projects := json.get("projects"):
-            for project_name, project_json in projects.items():
-                res[project_name] = Project(name=project_name, json=project_json, ws=self)
-        else:
+    def _parse_workspace_version(self, woid_version: str) -> Version:
+        try:
+            version_major, version_minor = woid_version.split(".")
+            return Version(int(version_major), int(version_minor))
+        except ValueError:
             log.fatal(
                 ErrorStrings.INVALID_WORKSPACE_JSON,
-                issue="Workspace does not define the required field 'projects'.",
-                erroneous_json=json,
+                issue="Workspace version does not follow the format <MAJOR>.<MINOR> (e.g. '0.1').",
+                erroneous_value=woid_version,
             )
-        return res
 
+    def init_all_repos(self) -> None:
+        """Initialize the git repositories of all projects concurrently."""
+        if not self.projects:
+            return
+
+        def _init(project: Project) -> Repo:
+            return project.repo
+
+        with ThreadPoolExecutor(max_workers=min(16, len(self.projects))) as executor:
+            _ = list(executor.map(_init, self.projects.values()))
+
+    @cached_property
+    def root_dir_str(self) -> str:
+        return os.fspath(self.root_dir)
 
     @override
     def __repr__(self) -> str:
@@ -188,12 +189,53 @@ class Workspace:
     def dump(self) -> dict[str, Any]:
         return {
             "woid-version": f"{self._woid_version.major}.{self._woid_version.minor}",
-            "root-dir": str(self.root_dir),
+            "root-dir": self.root_dir_str,
             "projects-dir": str(self.projects_dir),
             "hosts": [h.dump() for h in self.hosts.values()],
             "projects": [p.dump() for p in self.projects.values()],
         }
 
 
+def _check_entries(
+    path: Path,
+    kind: str,
+    entries: dict[str, msgspec.Raw],
+    decoder: msgspec.json.Decoder[Any],
+    help_renderable: ConsoleRenderable,
+) -> None:
+    for name, raw in entries.items():
+        try:
+            _ = decoder.decode(raw)
+        except msgspec.ValidationError as e:
+            log.fatal(
+                ErrorStrings.INVALID_WORKSPACE_JSON,
+                issue=f"{kind} '{name}' is invalid: {e}.",
+                path=path,
+                erroneous_json={name: msgspec.json.decode(raw)},
+                help=help_renderable,
+            )
+
+
+def _fatal_invalid_workspace(path: Path, data: bytes, error: msgspec.ValidationError) -> NoReturn:
+    # msgspec does not include dict keys in its error paths (e.g. "at `$.hosts[...]`"); on this error path only,
+    # the entries are decoded one by one, so that the broken one can be reported by name:
+    try:
+        raw = _RAW_WS_DECODER.decode(data)
+    except msgspec.ValidationError:
+        pass
+    else:
+        _check_entries(path, "Host", raw.hosts, _HOST_DECODER, Help.JsonFields.host_url())
+        _check_entries(path, "Project", raw.projects, _PROJECT_DECODER, Help.JsonFields.project_host())
+
+    # All entries are valid by themselves, so the error is in the top-level object:
+    log.fatal(
+        ErrorStrings.INVALID_WORKSPACE_JSON,
+        issue=f"{error}.",
+        path=path,
+        erroneous_json=msgspec.json.decode(data),
+        help=Help.JsonFields.workspace(),
+    )
+
+
 def print_workspace_status(ws: Workspace) -> None:
     pass